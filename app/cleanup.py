@@ -24,13 +24,10 @@ rebuild when necessary.
 import os
 import time
 import glob
-import configparser
-from utils import setup_logger
+from utils import setup_logger, load_conf
 
 # --- New Config Parser Logic ---
-config = configparser.ConfigParser()
-config_path = os.path.expanduser('~/hindsight/hindsight.conf')
-config.read(config_path)
+config = load_conf()
 
 # --- Fetching settings ---
 DAYS_TO_KEEP = config.getint('User Settings', 'DAYS_TO_KEEP')
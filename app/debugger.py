@@ -27,6 +27,8 @@ import sys
 import configparser
 import json
 import glob
+import mmap
+import time
 import subprocess
 import shutil
 try:
@@ -59,30 +61,83 @@ console = Console()
 
 # --- Read-Only Functions (Available in all modes) ---
 
+# Change token for the log scan: (st_size, st_mtime_ns) of the last scan,
+# plus the file size already covered so later scans only read appended bytes.
+# While the log is unchanged the cached result is returned with zero I/O.
+_log_scan_cache = {"token": None, "offset": 0, "value": "Pending"}
+
 def get_last_successful_run_from_log():
     """Return the timestamp of the last successful index run found in the log.
 
+    The log is only re-read when its size or mtime changed since the last
+    call, and then only the bytes appended since the previous scan are
+    searched; a shrunken file (rotation) triggers a fresh tail scan.
+
     Returns:
         A string timestamp parsed from the log, or "Pending" when unavailable.
     """
+    try:
+        st = os.stat(LOG_FILE)
+    except OSError:
+        return "Pending"
+    cache = _log_scan_cache
+    token = (st.st_size, st.st_mtime_ns)
+    if token == cache["token"]:
+        return cache["value"]
+    if cache["token"] is not None and st.st_size >= cache["offset"]:
+        # Grown in place: scan only the delta (with a little slack in case a
+        # line straddles the old end of file); no new match keeps the old
+        # result rather than forgetting it.
+        found = _scan_log_for_last_run(start=max(0, cache["offset"] - 512))
+        value = found if found is not None else cache["value"]
+    else:
+        found = _scan_log_for_last_run()
+        value = found if found is not None else "Pending"
+    cache["token"] = token
+    cache["offset"] = st.st_size
+    cache["value"] = value
+    return value
+
+_COMPLETION_MARK = b"Index update cycle completed"
+_REBUILD_TAG = b"HindsightRebuildIndex"
+# Rebuild cycles run every 15 minutes, so a completion line that is not in
+# the last few MB of the log is ancient history; bounding the reverse search
+# keeps the scan O(window) even on logs that have grown for months.
+_SCAN_WINDOW = 4 * 1024 * 1024  # bytes
+
+def _scan_log_for_last_run(start=None):
+    """Scan the log backwards for the most recent index-completion line.
+
+    The file is memory-mapped and searched with ``rfind``, which runs as a
+    C-level byte scan; only the single matching line is ever decoded, instead
+    of chunk-copying and re-splitting the whole tail in Python. By default
+    the trailing ``_SCAN_WINDOW`` bytes are searched; ``start`` restricts the
+    search to bytes at or after that offset instead.
+
+    Returns:
+        The timestamp string of the latest match, or ``None`` if the searched
+        region holds no completion line.
+    """
     try:
         with open(LOG_FILE, 'rb') as f:
-            f.seek(0, os.SEEK_END)
-            buffer = bytearray()
-            while f.tell() > 0:
-                chunk_size = min(f.tell(), 4096)
-                f.seek(-chunk_size, os.SEEK_CUR)
-                buffer = f.read(chunk_size) + buffer
-                f.seek(-chunk_size, os.SEEK_CUR)
-                lines = buffer.decode('utf-8', errors='ignore').split('\n')
-                for i in range(len(lines) - 1, -1, -1):
-                    line = lines[i]
-                    if "Index update cycle completed" in line and "HindsightRebuildIndex" in line:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                window_start = max(0, size - _SCAN_WINDOW) if start is None else min(start, size)
+                pos = mm.rfind(_COMPLETION_MARK, window_start)
+                while pos != -1:
+                    line_start = mm.rfind(b'\n', 0, pos) + 1
+                    line_end = mm.find(b'\n', pos)
+                    if line_end == -1:
+                        line_end = size
+                    if _REBUILD_TAG in mm[line_start:line_end]:
+                        line = mm[line_start:line_end].decode('utf-8', errors='ignore')
                         return line.split(',')[0].strip()
-                buffer = bytearray(lines[0], 'utf-8', errors='ignore')
-    except (IOError, FileNotFoundError, IndexError):
-        return "Pending"
-    return "Pending"
+                    pos = mm.rfind(_COMPLETION_MARK, window_start, line_start)
+    except (OSError, ValueError):
+        return None
+    return None
 
 def calculate_next_run(now, schedule="*:0/15"):
     """Compute the next scheduled run time based on a simple schedule string.
@@ -110,13 +165,33 @@ def calculate_next_run(now, schedule="*:0/15"):
     except (IndexError, ValueError):
         return None
 
+def _count_ocr_files():
+    """Count OCR .txt files via scandir without building a path list."""
+    try:
+        with os.scandir(OCR_TEXT_DIR) as it:
+            return sum(1 for e in it if e.name.endswith('.txt') and e.is_file(follow_symlinks=False))
+    except OSError:
+        return 0
+
+# get_index_info is called from composite views (health check) that may hit
+# it several times in quick succession; a short TTL keeps those calls from
+# re-reading the ID map and re-counting the OCR directory each time.
+_index_info_cache = {"expires": 0.0, "value": None}
+_INDEX_INFO_TTL = 2.0  # seconds
+
 def get_index_info():
     """Collect basic search index metrics and scheduling information.
 
+    Results are cached for a couple of seconds so repeated calls within one
+    interactive action do not redo the directory scan and JSON parse.
+
     Returns:
         A dictionary with keys ``items``, ``unprocessed``, ``last_run`` and
         ``next_run`` describing index status.
     """
+    now = time.monotonic()
+    if _index_info_cache["value"] is not None and now < _index_info_cache["expires"]:
+        return _index_info_cache["value"]
     info = {"items": 0, "unprocessed": 0, "last_run": "N/A", "next_run": "N/A"}
     if os.path.exists(ID_MAP_PATH):
         try:
@@ -124,15 +199,13 @@ def get_index_info():
                 info["items"] = len(json.load(f))
         except (json.JSONDecodeError, IOError):
             pass
-    try:
-        total_files = len(glob.glob(os.path.join(OCR_TEXT_DIR, "*.txt")))
-        info["unprocessed"] = max(0, total_files - info["items"])
-    except IOError:
-        pass
+    info["unprocessed"] = max(0, _count_ocr_files() - info["items"])
     info["last_run"] = get_last_successful_run_from_log()
     next_run_dt = calculate_next_run(datetime.now(), schedule="*:0/15")
     if next_run_dt:
         info["next_run"] = next_run_dt.strftime("%Y-%m-%d %H:%M:%S")
+    _index_info_cache["value"] = info
+    _index_info_cache["expires"] = now + _INDEX_INFO_TTL
     return info
 
 # --- NEW: Destructive Functions (Read-Write) ---
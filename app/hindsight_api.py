@@ -27,7 +27,7 @@ import os
 import subprocess
 import psutil
 import json
-import glob
+import time
 from datetime import datetime, timezone, timedelta
 import stat
 
@@ -78,36 +78,81 @@ def get_service_status(unit_name):
     except subprocess.CalledProcessError:
         return "[red]○ Not Found[/red]"
 
+def format_timer_status(state):
+    """Map a raw timer state to a colored label ("active" means waiting)."""
+    if state == "active":
+        return "[green]● Waiting[/green]"
+    if state == "unknown":
+        return "[red]○ Not Found[/red]"
+    return "[yellow]○ Inactive[/yellow]"
+
 def get_timer_status(timer_name):
     """Checks the status of a systemd timer."""
     try:
         # Timers must be checked with systemctl
         output = subprocess.check_output(["systemctl", "--user", "is-active", timer_name], text=True, stderr=subprocess.DEVNULL).strip()
-        if output == "active":
-            return "[green]● Waiting[/green]" # "active" for a timer means it's enabled and waiting
-        else:
-            return "[yellow]○ Inactive[/yellow]"
+        return format_timer_status(output)
     except subprocess.CalledProcessError:
         return "[red]○ Not Found[/red]"
 
+# Hindsight's process set changes rarely, so Process handles are cached and
+# the full process_iter sweep (which stats every PID on the system) runs only
+# when the cache is empty or has gone stale.
+_hs_procs = {}
+_last_proc_scan = 0.0
+_PROC_RESCAN_INTERVAL = 30.0  # seconds
+
+# Every Hindsight process is a python script or a shell wrapper, so anything
+# else can be rejected on the cheap 'name' field before the cmdline (which
+# psutil reads from /proc per process) is even joined.
+_HS_PROC_NAMES = frozenset(("python", "python3", "bash", "sh"))
+
+def _rescan_hindsight_procs():
+    """Walk the process table and return {pid: Process} for Hindsight scripts."""
+    procs = {}
+    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        try:
+            if proc.info['name'] not in _HS_PROC_NAMES:
+                continue
+            cmdline = " ".join(proc.info['cmdline']) if proc.info['cmdline'] else ""
+            if 'hindsight' in cmdline or 'memory_daemon.py' in cmdline or 'hindsight_api.py' in cmdline:
+                pid = proc.info['pid']
+                cached = _hs_procs.get(pid)
+                if cached is None:
+                    # Arm the sampler so the first real poll reports a delta
+                    # instead of 0.0 from a brand-new handle.
+                    cached = psutil.Process(pid)
+                    cached.cpu_percent(interval=None)
+                procs[pid] = cached
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return procs
+
 def get_resource_usage():
     """Calculates resource usage for all Hindsight-related python scripts."""
+    global _hs_procs, _last_proc_scan
+    now = time.monotonic()
+    for pid, p in list(_hs_procs.items()):
+        if not p.is_running():
+            del _hs_procs[pid]
+    if not _hs_procs or now - _last_proc_scan >= _PROC_RESCAN_INTERVAL:
+        _hs_procs = _rescan_hindsight_procs()
+        _last_proc_scan = now
+
     cpu_total = 0.0
     mem_total = 0.0
     io_read_total = 0
     io_write_total = 0
-
-    # Find all running hindsight processes
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    for p in _hs_procs.values():
         try:
-            cmdline = " ".join(proc.info['cmdline']) if proc.info['cmdline'] else ""
-            if 'hindsight' in cmdline or 'memory_daemon.py' in cmdline or 'hindsight_api.py' in cmdline:
-                p = psutil.Process(proc.info['pid'])
-                cpu_total += p.cpu_percent(interval=None)
-                mem_total += p.memory_info().rss
-                io = p.io_counters()
-                io_read_total += io.read_bytes
-                io_write_total += io.write_bytes
+            # Reusing the same Process object also makes cpu_percent a real
+            # delta since the previous call rather than always reading 0.0
+            # from a freshly constructed handle.
+            cpu_total += p.cpu_percent(interval=None)
+            mem_total += p.memory_info().rss
+            io = p.io_counters()
+            io_read_total += io.read_bytes
+            io_write_total += io.write_bytes
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
 
@@ -129,11 +174,24 @@ def format_time(ts):
     except Exception:
         return "N/A"
 
+def count_ocr_files():
+    """Count OCR .txt files without materializing a list of path strings.
+
+    ``os.scandir`` yields dirents lazily; checking ``.name`` and
+    ``is_file(follow_symlinks=False)`` uses the dirent's type where the
+    filesystem provides it, so no extra stat calls are made per entry.
+    """
+    try:
+        with os.scandir(OCR_TEXT_DIR) as it:
+            return sum(1 for e in it if e.name.endswith('.txt') and e.is_file(follow_symlinks=False))
+    except OSError:
+        return 0
+
 def get_faiss_stats():
     """Return FAISS processed/unprocessed counts and last run time."""
     if not ENABLE_FAISS:
         return {"faiss_processed": "Disabled", "faiss_unprocessed": "Disabled", "faiss_last_run": "-"}
-    total_txt = len(glob.glob(os.path.join(OCR_TEXT_DIR, '*.txt')))
+    total_txt = count_ocr_files()
     processed = 0
     if os.path.exists(ID_MAP_PATH):
         try:
@@ -164,7 +222,7 @@ def get_recoll_stats():
     if not ENABLE_RECOLL:
         return {"recoll_processed": "Disabled", "recoll_unprocessed": "Disabled", "recoll_last_run": "-"}
     xapiandb = os.path.join(RECOLL_CONF_DIR, 'xapiandb')
-    total_txt = len(glob.glob(os.path.join(OCR_TEXT_DIR, '*.txt')))
+    total_txt = count_ocr_files()
     if not os.path.isdir(xapiandb):
         return {"recoll_processed": "0", "recoll_unprocessed": f"{total_txt}", "recoll_last_run": "N/A"}
     # Determine index last update time by newest file in xapiandb
@@ -184,12 +242,18 @@ def get_recoll_stats():
     # Count unprocessed = OCR files newer than latest mtime
     unprocessed = 0
     if latest:
-        for fpath in glob.glob(os.path.join(OCR_TEXT_DIR, '*.txt')):
-            try:
-                if os.path.getmtime(fpath) > latest:
-                    unprocessed += 1
-            except Exception:
-                continue
+        try:
+            with os.scandir(OCR_TEXT_DIR) as it:
+                for e in it:
+                    if not e.name.endswith('.txt'):
+                        continue
+                    try:
+                        if e.stat().st_mtime > latest:
+                            unprocessed += 1
+                    except OSError:
+                        continue
+        except OSError:
+            pass
     else:
         unprocessed = total_txt
     processed = max(total_txt - unprocessed, 0)
@@ -202,13 +266,68 @@ def get_recoll_stats():
 def get_db_stats():
     """Calculates database size and record count."""
     try:
-        file_list = glob.glob(os.path.join(OCR_TEXT_DIR, '*.txt'))
-        num_records = len(file_list)
-        total_size = sum(os.path.getsize(f) for f in file_list)
+        num_records = 0
+        total_size = 0
+        with os.scandir(OCR_TEXT_DIR) as it:
+            for e in it:
+                if e.name.endswith('.txt') and e.is_file(follow_symlinks=False):
+                    num_records += 1
+                    total_size += e.stat().st_size
         return f"{total_size / (1024 * 1024):.2f} MB", f"{num_records:,}"
     except Exception:
         return "N/A", "N/A"
 
+# --- Tiered status caching ---
+# Not every status block deserves a fresh fetch per request: service state
+# changes seconds apart and index stats change minutes apart, while resource
+# usage is genuinely live. Each block carries its own TTL so the expensive
+# systemctl/scandir/json work runs only when its cadence elapses.
+_STATUS_TTLS = {"services": 3.0, "index": 10.0, "resources": 1.0}
+_status_cache = {}
+
+def _cached_block(key, builder):
+    """Return the cached status block for ``key``, rebuilding it when its TTL expires."""
+    now = time.monotonic()
+    entry = _status_cache.get(key)
+    if entry and now < entry[0]:
+        return entry[1]
+    value = builder()
+    _status_cache[key] = (now + _STATUS_TTLS[key], value)
+    return value
+
+_SERVICE_UNITS = ("hindsight-api.service", "hindsight-daemon.service", "hindsight-rebuild.timer")
+
+def _collect_services():
+    # One systemctl fork covers all three units: is-active prints one state
+    # per line in argument order and only sets a non-zero exit code when some
+    # unit is not active, so the output is usable either way.
+    try:
+        proc = subprocess.run(
+            ["systemctl", "--user", "is-active", *_SERVICE_UNITS],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        states = proc.stdout.split()
+    except OSError:
+        states = []
+    if len(states) != len(_SERVICE_UNITS):
+        states = ["unknown"] * len(_SERVICE_UNITS)
+    return {
+        "api_status": format_status(states[0]),
+        "daemon_status": format_status(states[1]),
+        "timer_status": format_timer_status(states[2]),
+    }
+
+def _collect_resources():
+    cpu, mem, io = get_resource_usage()
+    return {"cpu_usage": cpu, "mem_usage": mem, "io_usage": io}
+
+def _collect_index_stats():
+    db_size, total_records = get_db_stats()
+    stats = {"db_size": db_size, "total_records": total_records}
+    stats.update(get_recoll_stats())
+    stats.update(get_faiss_stats())
+    stats["next_update"] = get_index_schedule()
+    return stats
+
 # --- Existing /query Endpoint (No changes needed) ---
 @app.route('/query', methods=['POST'])
 def query():
@@ -225,30 +344,13 @@ def query():
 @app.route('/status', methods=['GET'])
 def get_status():
     """Gathers all system and application metrics and returns them as a single JSON object."""
-    cpu, mem, io = get_resource_usage()
-    db_size, total_records = get_db_stats()
-
-    faiss_stats = get_faiss_stats()
-    recoll_stats = get_recoll_stats()
-
     status_data = {
-        # Service Status
-        "api_status": get_service_status("hindsight-api.service"),
-        "daemon_status": get_service_status("hindsight-daemon.service"),
-        "timer_status": get_timer_status("hindsight-rebuild.timer"),
-        # Resource Usage
-        "cpu_usage": cpu,
-        "mem_usage": mem,
-        "io_usage": io,
-        # Index Stats
-        "db_size": db_size,
-        "total_records": total_records,
-        # Recoll details
-        **recoll_stats,
-        # FAISS details
-        **faiss_stats,
-        # Shared schedule (timer drives both phases)
-        "next_update": get_index_schedule()
+        # Service Status (3s TTL - states flip seconds apart at most)
+        **_cached_block("services", _collect_services),
+        # Resource Usage (1s TTL - genuinely live)
+        **_cached_block("resources", _collect_resources),
+        # Index Stats incl. Recoll/FAISS details and shared schedule (10s TTL)
+        **_cached_block("index", _collect_index_stats),
     }
     return jsonify(status_data)
 
@@ -28,13 +28,10 @@ import numpy as np
 import faiss
 from sentence_transformers import SentenceTransformer
 import google.generativeai as genai
-import configparser
-from utils import setup_logger
+from utils import setup_logger, load_conf
 
 # --- New Config Parser Logic ---
-config = configparser.ConfigParser()
-config_path = os.path.expanduser('~/hindsight/hindsight.conf')
-config.read(config_path)
+config = load_conf()
 
 # --- Fetching settings ---
 REFINER_MODEL = config.get('User Settings', 'REFINER_MODEL')
@@ -123,7 +120,9 @@ def get_faiss_matches(query, num_results=5):
         logger.warning("FAISS index or embedding model not loaded, skipping semantic search.")
         return []
     try:
-        query_embedding = embedding_model.encode(query)
+        # Normalized to match the unit-length vectors the rebuild stores, so
+        # L2 distance ranks by cosine similarity.
+        query_embedding = embedding_model.encode(query, normalize_embeddings=True)
 
         query_vector = np.array([query_embedding]).astype('float32')
         distances, indices = faiss_index.search(query_vector, num_results)
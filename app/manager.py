@@ -20,18 +20,27 @@ control Hindsight services, view status, and run management actions.
 """
 
 
+import functools
 import subprocess
 import time
 import os
 import sys
 import configparser
+import pickle
 import shutil
-import select
+import selectors
+import stat
 import termios
-import tty
 import threading
-import queue
+import tty
 import requests
+from requests.adapters import HTTPAdapter
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 from rich.console import Console
 from rich.layout import Layout
 from rich.live import Live
@@ -40,12 +49,56 @@ from rich.table import Table
 from rich.text import Text
 
 # --- Configuration Loading ---
-config = configparser.ConfigParser()
 config_path = os.path.expanduser('~/hindsight/hindsight.conf')
-if not os.path.exists(config_path):
-    print(f"Error: Configuration file not found at {config_path}")
+_CONF_CACHE_PATH = os.path.expanduser('~/.cache/hindsight/conf.pkl')
+
+def _load_config_cached(path):
+    """Parse hindsight.conf into plain dicts, cached on disk keyed by mtime.
+
+    Subsequent manager launches skip the configparser state machine entirely
+    as long as the config file hasn't changed; the cache is rebuilt
+    transparently whenever it has.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        print(f"Error: Configuration file not found at {path}")
+        sys.exit(1)
+    try:
+        with open(_CONF_CACHE_PATH, 'rb') as f:
+            cached_mtime, sections = pickle.load(f)
+        if cached_mtime == mtime_ns:
+            return sections
+    except Exception:
+        pass
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    sections = {name: dict(parser.items(name)) for name in parser.sections()}
+    try:
+        os.makedirs(os.path.dirname(_CONF_CACHE_PATH), exist_ok=True)
+        with open(_CONF_CACHE_PATH, 'wb') as f:
+            pickle.dump((mtime_ns, sections), f)
+    except OSError:
+        pass
+    return sections
+
+config = _load_config_cached(config_path)
+
+_MISSING = object()
+
+def _cfg(section, option, fallback=_MISSING):
+    """Look up a config option, exiting with a helpful message when required.
+
+    Option names are matched case-insensitively, mirroring configparser.
+    """
+    sect = config.get(section)
+    if sect is not None and option.lower() in sect:
+        return sect[option.lower()]
+    if fallback is not _MISSING:
+        return fallback
+    missing_item = f"option '{option}'" if sect is not None else f"section '[{section}]'"
+    print(f"Error: Your hindsight.conf file is incomplete. Missing {missing_item}.")
     sys.exit(1)
-config.read(config_path)
 
 # --- Pre-Flight Check for Terminal Configuration ---
 def pre_flight_check():
@@ -53,13 +106,8 @@ def pre_flight_check():
     Verifies the configured terminal is valid before launching the main UI.
     If it's invalid, it runs the detection script to let the user fix it.
     """
-    try:
-        terminal_cmd = config.get('User Settings', 'TERMINAL_CMD').strip('\'"')
-        scripts_path = config.get('System Paths', 'SCRIPTS_PATH')
-    except (configparser.NoSectionError, configparser.NoOptionError) as e:
-        missing_item = f"section '[{e.section}]'" if isinstance(e, configparser.NoSectionError) else f"option '{e.option}'"
-        print(f"Error: Your hindsight.conf file is incomplete. Missing {missing_item}.")
-        sys.exit(1)
+    terminal_cmd = _cfg('User Settings', 'TERMINAL_CMD').strip('\'"')
+    scripts_path = _cfg('System Paths', 'SCRIPTS_PATH')
     if not shutil.which(terminal_cmd):
         print(f"\n[ERROR] The configured terminal '{terminal_cmd}' was not found.")
         detector_script = os.path.join(scripts_path, "detect_terminal.sh")
@@ -73,13 +121,13 @@ def pre_flight_check():
 pre_flight_check()
 
 # --- Fetching settings ---
-TERMINAL_CMD = config.get('User Settings', 'TERMINAL_CMD').strip('\'"')
-SCRIPTS_PATH = config.get('System Paths', 'SCRIPTS_PATH')
-VENV_PATH = config.get('System Paths', 'VENV_PATH')
-APP_PATH = config.get('System Paths', 'APP_PATH')
-LOG_FILE = config.get('System Paths', 'LOG_FILE')
-API_URL = config.get('API', 'URL', fallback='http://127.0.0.1:5000').strip('\'"')
-THEME_MODE = config.get('User Settings', 'THEME_MODE', fallback='auto').lower()
+TERMINAL_CMD = _cfg('User Settings', 'TERMINAL_CMD').strip('\'"')
+SCRIPTS_PATH = _cfg('System Paths', 'SCRIPTS_PATH')
+VENV_PATH = _cfg('System Paths', 'VENV_PATH')
+APP_PATH = _cfg('System Paths', 'APP_PATH')
+LOG_FILE = _cfg('System Paths', 'LOG_FILE')
+API_URL = _cfg('API', 'URL', fallback='http://127.0.0.1:5000').strip('\'"')
+THEME_MODE = _cfg('User Settings', 'THEME_MODE', fallback='auto').lower()
 
 # --- Theme / Contrast Handling (improved) ---
 def _detect_from_colorfgbg():
@@ -111,87 +159,130 @@ def detect_theme_auto():
             return result
     return 'dark'
 
+# Auto-detection shells out to read the terminal profile, so it runs once at
+# import; _handle_theme refreshes it when the user cycles back to 'auto'.
+_AUTO_THEME = detect_theme_auto()
+
 def get_active_theme(app_state):
     override = app_state.get('theme_override')
     # Config value takes precedence when user hasn't toggled in-session
     if override is None or override == 'auto':
         if THEME_MODE in ('light', 'dark'):
             return THEME_MODE
-        return detect_theme_auto()
+        return _AUTO_THEME
     if override in ('light', 'dark'):
         return override
-    return detect_theme_auto()
+    return _AUTO_THEME
 
-def color_token(name, theme):
-    light = (theme == 'light')
-    palette = {
-        'accent': 'blue' if light else 'cyan',
+# Both theme palettes built once at import; color_token is a pure lookup so
+# the render path allocates no dicts.
+_PALETTE = {
+    'light': {
+        'accent': 'blue',
         'ok': 'green',
-        'warn': 'orange3' if light else 'yellow',
+        'warn': 'orange3',
         'bad': 'red',
         'pending_low': 'green',
-        'pending_mid': 'dark_orange' if light else 'yellow',
+        'pending_mid': 'dark_orange',
         'pending_high': 'red',
-        'flash': 'bold magenta' if light else 'bold yellow'
-    }
-    return palette.get(name, 'white')
+        'flash': 'bold magenta'
+    },
+    'dark': {
+        'accent': 'cyan',
+        'ok': 'green',
+        'warn': 'yellow',
+        'bad': 'red',
+        'pending_low': 'green',
+        'pending_mid': 'yellow',
+        'pending_high': 'red',
+        'flash': 'bold yellow'
+    },
+}
+
+def color_token(name, theme):
+    return _PALETTE[theme].get(name, 'white')
+
+# Pre-formatted markup templates for pending counts, indexed per theme by
+# bucket: 0 = nothing pending, 1 = under 50, 2 = 50 or more.
+_PENDING_TAGS = {
+    theme: tuple(f"[{palette[tok]}]{{}}[/{palette[tok]}]"
+                 for tok in ('pending_low', 'pending_mid', 'pending_high'))
+    for theme, palette in _PALETTE.items()
+}
 
 # --- Helper Functions ---
+# One keep-alive session for all status polls: the same TCP connection is
+# reused across the 2Hz loop instead of a fresh socket + pool per request.
+_http = requests.Session()
+_http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
+_http.headers["Connection"] = "keep-alive"
+
+# Placeholder returned whenever the API is unreachable; built once rather
+# than re-allocated on every failed poll.
+_DOWN_STATUS = {
+    "api_status": "[red]● Down[/red]", "daemon_status": "[red]● Unknown[/red]", "timer_status": "[red]● Unknown[/red]",
+    "cpu_usage": "N/A", "mem_usage": "N/A", "io_usage": "N/A",
+    "db_size": "N/A", "total_records": "N/A", "last_update": "N/A", "next_update": "N/A"
+}
+
 def get_hindsight_status_from_api():
     """Makes a single API call to get the status of all Hindsight components."""
     try:
-        response = requests.get(f"{API_URL}/status", timeout=0.9)
+        # (connect, read) split: a dead local API fails the connect in ~50ms
+        # instead of stalling the UI loop for the full 900ms budget.
+        response = _http.get(f"{API_URL}/status", timeout=(0.05, 0.5))
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException:
-        return {
-            "api_status": "[red]● Down[/red]", "daemon_status": "[red]● Unknown[/red]", "timer_status": "[red]● Unknown[/red]",
-            "cpu_usage": "N/A", "mem_usage": "N/A", "io_usage": "N/A",
-            "db_size": "N/A", "total_records": "N/A", "last_update": "N/A", "next_update": "N/A"
-        }
-
-def run_command(command):
-    """Runs a shell command in the background without blocking."""
-    subprocess.Popen(command, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return _json_loads(response.content)
+    except (requests.exceptions.RequestException, ValueError):
+        return _DOWN_STATUS
+
+# Single-slot mailbox holding the most recent status payload. The poller
+# thread is the only writer and reference assignment is atomic in CPython,
+# so the render loop can read it without a lock.
+_status_slot = [_DOWN_STATUS]
+
+def _status_poller():
+    """Fetch API status on a dedicated thread so HTTP latency never blocks rendering."""
+    while True:
+        _status_slot[0] = get_hindsight_status_from_api()
+        time.sleep(0.5)
+
+def run_command(argv):
+    """Launches an argv list in the background without blocking.
+
+    Uses ``os.posix_spawnp`` rather than fork+exec: no copy of this process's
+    page tables (Rich and friends make it a heavy one) and no intermediate
+    shell. Output is discarded, matching the old DEVNULL behaviour, and the
+    child gets its own session so a Ctrl-C aimed at the manager never
+    reaches launched terminals or scripts.
+    """
+    os.posix_spawnp(argv[0], argv, os.environ, setsid=True, file_actions=[
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0)])
 
-def create_terminal_command(command_to_run, graceful=True):
-    """Builds a full command string to launch a process in the user's configured terminal.
+# TERMINAL_CMD is fixed for the session, so the emulator's exec flag is too.
+_TERM_FLAG = "-e" if 'konsole' in TERMINAL_CMD else "--"
 
-    If graceful is True, wraps the command to neutralize Ctrl-C (SIGINT) so some terminals
-    don't display a scary 'bash crashed' notification when tail is interrupted.
+@functools.lru_cache(maxsize=16)
+def create_terminal_command(command_to_run, graceful=True):
+    """Builds an argv tuple to launch a command in the user's configured terminal.
+
+    The command itself still runs through ``bash -c`` (it needs shell glue for
+    the exit-message prompt), but the terminal emulator is spawned directly.
+    If graceful is True, the script neutralizes Ctrl-C (SIGINT) so some
+    terminals don't display a scary 'bash crashed' notification when tail is
+    interrupted. Results are memoized - the handful of menu commands are
+    fixed strings, so each argv is assembled once per session.
     """
     if graceful:
         # trap INT/TERM so tail exit looks clean; ensure non-zero exits don't propagate as crash
-        wrapped = (
-            "bash -c 'trap ':' SIGINT SIGTERM; "
-            f"{command_to_run} || true; rc=$?; echo -e \"\\n\\n(Exit code $rc) Press Enter to close.\"; read'"
+        script = (
+            "trap ':' SIGINT SIGTERM; "
+            f"{command_to_run} || true; rc=$?; echo -e \"\\n\\n(Exit code $rc) Press Enter to close.\"; read"
         )
     else:
-        wrapped = f"bash -c \"{command_to_run}; echo -e '\n\nPress Enter to close.'; read\""
-    if 'konsole' in TERMINAL_CMD:
-        return f"{TERMINAL_CMD} -e {wrapped}"
-    else:
-        return f"{TERMINAL_CMD} -- {wrapped}"
-
-def read_keyboard_input(input_queue):
-    """
-    A robust, blocking function to read a single character from stdin.
-    This will run in a separate thread.
-    """
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setcbreak(sys.stdin.fileno())
-        while True:
-            # This is a blocking read, it will wait for a key press
-            char = sys.stdin.read(1)
-            if char:
-                input_queue.put(char)
-            else: # EOF
-                time.sleep(0.1) # Prevent high CPU usage on unexpected EOF
-    finally:
-        # Restore terminal settings when the thread exits
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        script = f"{command_to_run}; echo -e '\\n\\nPress Enter to close.'; read"
+    return (TERMINAL_CMD, _TERM_FLAG, "bash", "-c", script)
 
 def flash(app_state, msg, duration=3):
     """Set a transient flash message in the application state.
@@ -204,6 +295,89 @@ def flash(app_state, msg, duration=3):
     app_state["flash"] = msg
     app_state["flash_until"] = time.time() + duration
 
+# --- Key Handlers ---
+class _ScriptInfo:
+    """Path plus a startup-time executability check for a managed script."""
+    __slots__ = ('path', 'ok')
+
+    def __init__(self, path):
+        self.path = path
+        # One stat answers both questions; isfile+access would hit the
+        # filesystem twice for the same inode.
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.ok = False
+        else:
+            self.ok = stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+# All script locations resolved and checked once at startup: key handlers do
+# no path joining or stat calls, and a misconfigured install is visible on
+# the first relevant keypress rather than intermittently.
+_SCRIPTS = {
+    'start': _ScriptInfo(os.path.join(SCRIPTS_PATH, "start_hindsight.sh")),
+    'stop': _ScriptInfo(os.path.join(SCRIPTS_PATH, "stop_hindsight.sh")),
+    'configure': _ScriptInfo(os.path.join(SCRIPTS_PATH, "configure.sh")),
+    'debugger': _ScriptInfo(os.path.join(APP_PATH, "debugger.py")),
+}
+_PYTHON_EXEC = os.path.join(VENV_PATH, "bin", "python")
+
+def _handle_start(app_state):
+    script = _SCRIPTS['start']
+    if script.ok:
+        run_command([script.path])
+        flash(app_state, "Starting services...")
+    else:
+        flash(app_state, "start_hindsight.sh missing/not executable.")
+
+def _handle_stop(app_state):
+    script = _SCRIPTS['stop']
+    if script.ok:
+        run_command([script.path])
+        flash(app_state, "Stopping services...")
+    else:
+        flash(app_state, "stop_hindsight.sh missing or not executable.")
+
+def _handle_logs(app_state):
+    # Use graceful wrapper to avoid 'bash crashed' dialog on Ctrl-C
+    run_command(create_terminal_command(f"tail -n 200 -f {LOG_FILE}", graceful=True))
+
+def _handle_edit_config(app_state):
+    editor = os.environ.get('EDITOR', 'nano')
+    run_command(create_terminal_command(f"'{editor}' '{config_path}'"))
+
+def _handle_reconfigure(app_state):
+    run_command(create_terminal_command(f"'{_SCRIPTS['configure'].path}'"))
+
+def _handle_debugger(app_state):
+    run_command(create_terminal_command(f"'{_PYTHON_EXEC}' '{_SCRIPTS['debugger'].path}'"))
+
+def _handle_force_index(app_state):
+    run_command(["systemctl", "--user", "start", "hindsight-rebuild.service"])
+    flash(app_state, "Index cycle triggered.")
+
+def _handle_theme(app_state):
+    global _AUTO_THEME
+    current = app_state.get('theme_override') or 'auto'
+    nxt = {'auto': 'light', 'light': 'dark', 'dark': 'auto'}[current]
+    if nxt == 'auto':
+        # The terminal profile may have changed since import; re-detect once
+        # on the toggle instead of on every frame.
+        _AUTO_THEME = detect_theme_auto()
+    app_state['theme_override'] = nxt
+    flash(app_state, f"Theme: {nxt}")
+
+_KEY_HANDLERS = {
+    '1': _handle_start,
+    '2': _handle_stop,
+    '3': _handle_logs,
+    '4': _handle_edit_config,
+    '5': _handle_reconfigure,
+    '6': _handle_debugger,
+    '7': _handle_force_index,
+    't': _handle_theme,
+}
+
 # --- UI Rendering ---
 def make_layout():
     """Defines the full Rich layout structure ONE time."""
@@ -213,78 +387,145 @@ def make_layout():
     layout["top_row"].split_row(Layout(name="system_status"), Layout(name="resources"))
     return layout
 
+# Status strings arrive from the API as literal markup ("[red]● Down[/red]")
+# drawn from a small closed set; memoizing the parse means Rich tokenizes
+# each distinct string once instead of on every add_row.
+_markup_text = functools.lru_cache(maxsize=64)(Text.from_markup)
+
+# Cache of built panel renderables keyed on the data that produced them.
+# Reusing the same Panel instance when content is unchanged lets Rich's
+# renderer fast-path identical frames instead of rebuilding grids at 2Hz.
+_panel_cache = {}
+
+def _cached_panel(name, key, builder):
+    """Return the cached Panel for ``name``, rebuilding only when ``key`` changes."""
+    entry = _panel_cache.get(name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    panel = builder()
+    _panel_cache[name] = (key, panel)
+    return panel
+
+# Row labels never change, so their markup is parsed into Text objects once
+# at import instead of being re-parsed on every panel rebuild.
+_LBL_API = Text.from_markup("[bold]API Service:[/bold]")
+_LBL_DAEMON = Text.from_markup("[bold]Memory Daemon:[/bold]")
+_LBL_TIMER = Text.from_markup("[bold]Rebuild Timer:[/bold]")
+_LBL_CPU = Text.from_markup("[bold]CPU Usage:[/bold]")
+_LBL_MEM = Text.from_markup("[bold]Memory Usage:[/bold]")
+_LBL_IO = Text.from_markup("[bold]File I/O:[/bold]")
+_LBL_DB_SIZE = Text.from_markup("[bold]Database Size:[/bold]")
+_LBL_NEXT_RUN = Text.from_markup("[bold]Next Run:[/bold]")
+_LBL_RECOLL_PROC = Text.from_markup("[bold]Recoll Proc:[/bold]")
+_LBL_RECOLL_PENDING = Text.from_markup("[bold]Recoll Pending:[/bold]")
+_LBL_RECOLL_LAST = Text.from_markup("[bold]Recoll Last:[/bold]")
+_LBL_FAISS_PROC = Text.from_markup("[bold]FAISS Proc:[/bold]")
+_LBL_FAISS_PENDING = Text.from_markup("[bold]FAISS Pending:[/bold]")
+_LBL_FAISS_LAST = Text.from_markup("[bold]FAISS Last:[/bold]")
+
+def _build_services_panel(status_data):
+    status_grid = Table.grid(expand=True, padding=(0, 1))
+    status_grid.add_column(justify="right"); status_grid.add_column(justify="left")
+    status_grid.add_row(_LBL_API, _markup_text(status_data.get('api_status', 'Error')))
+    status_grid.add_row(_LBL_DAEMON, _markup_text(status_data.get('daemon_status', 'Error')))
+    status_grid.add_row(_LBL_TIMER, _markup_text(status_data.get('timer_status', 'Error')))
+    return Panel(status_grid, title="[bold]Service Status[/bold]")
+
+def _build_resources_panel(status_data):
+    resource_table = Table.grid(expand=True, padding=(0, 1))
+    resource_table.add_column(justify="right"); resource_table.add_column(justify="left")
+    resource_table.add_row(_LBL_CPU, status_data.get('cpu_usage', 'Error'))
+    resource_table.add_row(_LBL_MEM, status_data.get('mem_usage', 'Error'))
+    resource_table.add_row(_LBL_IO, status_data.get('io_usage', 'Error'))
+    return Panel(resource_table, title="[bold]Live Resources[/bold]")
+
+def style_pending(raw, theme):
+    # isdigit fast-path instead of int()+ValueError: exception unwinding is
+    # far more expensive than the common non-numeric check.
+    val = str(raw)
+    if not val.isdigit():
+        return val
+    num = int(val)
+    return _PENDING_TAGS[theme][(num > 0) + (num >= 50)].format(num)
+
+def _build_index_panel(status_data, theme):
+    recoll_proc = status_data.get('recoll_processed','?')
+    recoll_pending = style_pending(status_data.get('recoll_unprocessed','?'), theme)
+    recoll_last = status_data.get('recoll_last_run','N/A')
+    faiss_proc = status_data.get('faiss_processed','?')
+    faiss_pending = style_pending(status_data.get('faiss_unprocessed','?'), theme)
+    faiss_last = status_data.get('faiss_last_run','N/A')
+
+    grid = Table.grid(expand=True, padding=(0,1))
+    # Left pair (Recoll) and Right pair (FAISS)
+    grid.add_column(justify="right", no_wrap=True)
+    grid.add_column(justify="left")
+    grid.add_column(justify="right", no_wrap=True)
+    grid.add_column(justify="left")
+
+    # Assemble the cell values first, then feed the grid in one pass; the
+    # row data stays a plain tuple-of-tuples that is cheap to build and easy
+    # to extend without touching the add_row plumbing.
+    rows = (
+        (_LBL_DB_SIZE, status_data.get('db_size','N/A'),
+         _LBL_FAISS_PROC, f"{faiss_proc} vectors"),
+        (_LBL_NEXT_RUN, status_data.get('next_update','N/A'),
+         _LBL_FAISS_PENDING, _markup_text(faiss_pending)),
+        (_LBL_RECOLL_PROC, f"{recoll_proc} files",
+         _LBL_FAISS_LAST, faiss_last),
+        (_LBL_RECOLL_PENDING, _markup_text(recoll_pending),
+         _LBL_RECOLL_LAST, recoll_last),
+    )
+    for row in rows:
+        grid.add_row(*row)
+
+    return Panel(grid, title="[bold]Index Status[/bold]")
+
+# The footer menu is constant; parse its markup and wrap it in a Panel once.
+# Flash variants (menu + transient message) are memoized per message/color.
+_BASE_MENU = ("(1) Start/Restart All | (2) Stop All | (3) View Logs | (4) Edit Config\n"
+    "(5) Reconfigure | (6) Debugger | (7) Force Index Now | (t) Theme | (q) Quit")
+_BASE_FOOTER_PANEL = Panel(Text.from_markup(_BASE_MENU, justify="center"),
+                           title="[bold]Actions[/bold]", border_style="blue")
+
+@functools.lru_cache(maxsize=16)
+def _flash_footer_panel(flash_msg, flash_color):
+    menu = _BASE_MENU + f"\n[{flash_color}]{flash_msg}[/{flash_color}]"
+    return Panel(Text.from_markup(menu, justify="center"),
+                 title="[bold]Actions[/bold]", border_style="blue")
+
+_SERVICE_KEYS = ('api_status', 'daemon_status', 'timer_status')
+_RESOURCE_KEYS = ('cpu_usage', 'mem_usage', 'io_usage')
+_INDEX_KEYS = ('db_size', 'next_update', 'recoll_processed', 'recoll_unprocessed',
+               'recoll_last_run', 'faiss_processed', 'faiss_unprocessed', 'faiss_last_run')
+
 def update_dashboard_layout(layout, status_data, app_state):
     """Renders the dashboard using data received from the API."""
     layout["header"].update(Text("Hindsight Manager", style="bold blue", justify="center"))
 
     if app_state["mode"] == "normal":
-        # --- Service Status Panel ---
-        status_grid = Table.grid(expand=True, padding=(0, 1))
-        status_grid.add_column(justify="right"); status_grid.add_column(justify="left")
-        status_grid.add_row("[bold]API Service:[/bold]", status_data.get('api_status', 'Error'))
-        status_grid.add_row("[bold]Memory Daemon:[/bold]", status_data.get('daemon_status', 'Error'))
-        status_grid.add_row("[bold]Rebuild Timer:[/bold]", status_data.get('timer_status', 'Error'))
-        layout["system_status"].update(Panel(status_grid, title="[bold]Service Status[/bold]"))
-
-        # --- Live Resources Panel ---
-        resource_table = Table.grid(expand=True, padding=(0, 1))
-        resource_table.add_column(justify="right"); resource_table.add_column(justify="left")
-        resource_table.add_row("[bold]CPU Usage:[/bold]", status_data.get('cpu_usage', 'Error'))
-        resource_table.add_row("[bold]Memory Usage:[/bold]", status_data.get('mem_usage', 'Error'))
-        resource_table.add_row("[bold]File I/O:[/bold]", status_data.get('io_usage', 'Error'))
-        layout["resources"].update(Panel(resource_table, title="[bold]Live Resources[/bold]"))
-
-        # --- Index Status Panel (Two-column compact layout) ---
-        active_theme = get_active_theme(app_state)
+        layout["system_status"].update(_cached_panel(
+            "services",
+            tuple(status_data.get(k) for k in _SERVICE_KEYS),
+            lambda: _build_services_panel(status_data)))
 
-        def style_pending(raw):
-            val = str(raw)
-            try:
-                num = int(val)
-            except ValueError:
-                return val
-            if num == 0:
-                c = color_token('pending_low', active_theme)
-                return f"[{c}]{num}[/{c}]"
-            if num < 50:
-                c = color_token('pending_mid', active_theme)
-                return f"[{c}]{num}[/{c}]"
-            c = color_token('pending_high', active_theme)
-            return f"[{c}]{num}[/{c}]"
-
-        recoll_proc = status_data.get('recoll_processed','?')
-        recoll_pending = style_pending(status_data.get('recoll_unprocessed','?'))
-        recoll_last = status_data.get('recoll_last_run','N/A')
-        faiss_proc = status_data.get('faiss_processed','?')
-        faiss_pending = style_pending(status_data.get('faiss_unprocessed','?'))
-        faiss_last = status_data.get('faiss_last_run','N/A')
-
-        grid = Table.grid(expand=True, padding=(0,1))
-        # Left pair (Recoll) and Right pair (FAISS)
-        grid.add_column(justify="right", no_wrap=True)
-        grid.add_column(justify="left")
-        grid.add_column(justify="right", no_wrap=True)
-        grid.add_column(justify="left")
-
-        grid.add_row("[bold]Database Size:[/bold]", status_data.get('db_size','N/A'),
-                     "[bold]FAISS Proc:[/bold]", f"{faiss_proc} vectors")
-        grid.add_row("[bold]Next Run:[/bold]", status_data.get('next_update','N/A'),
-                     "[bold]FAISS Pending:[/bold]", faiss_pending)
-        grid.add_row("[bold]Recoll Proc:[/bold]", f"{recoll_proc} files",
-                     "[bold]FAISS Last:[/bold]", faiss_last)
-        grid.add_row("[bold]Recoll Pending:[/bold]", recoll_pending,
-                     "[bold]Recoll Last:[/bold]", recoll_last)
-
-        layout["index_status"].update(Panel(grid, title="[bold]Index Status[/bold]"))
+        layout["resources"].update(_cached_panel(
+            "resources",
+            tuple(status_data.get(k) for k in _RESOURCE_KEYS),
+            lambda: _build_resources_panel(status_data)))
+
+        active_theme = get_active_theme(app_state)
+        layout["index_status"].update(_cached_panel(
+            "index",
+            (active_theme,) + tuple(status_data.get(k) for k in _INDEX_KEYS),
+            lambda: _build_index_panel(status_data, active_theme)))
 
     # --- Footer Panel ---
-    menu = ("(1) Start/Restart All | (2) Stop All | (3) View Logs | (4) Edit Config\n"
-        "(5) Reconfigure | (6) Debugger | (7) Force Index Now | (t) Theme | (q) Quit")
     if app_state.get("flash") and time.time() < app_state.get("flash_until", 0):
         flash_color = color_token('flash', get_active_theme(app_state))
-        menu += f"\n[{flash_color}]{app_state['flash']}[/{flash_color}]"
-    # Use from_markup so color/style tags in flash message render properly
-    layout["footer"].update(Panel(Text.from_markup(menu, justify="center"), title="[bold]Actions[/bold]", border_style="blue"))
+        layout["footer"].update(_flash_footer_panel(app_state['flash'], flash_color))
+    else:
+        layout["footer"].update(_BASE_FOOTER_PANEL)
 
 # --- Main Application ---
 if __name__ == "__main__":
@@ -292,58 +533,51 @@ if __name__ == "__main__":
     layout = make_layout()
     app_state = {"mode": "normal", "theme_override": None}
 
-    input_queue = queue.Queue()
-    input_thread = threading.Thread(target=read_keyboard_input, args=(input_queue,), daemon=True)
-    input_thread.start()
-    
-    # The termios/tty logic is now handled by the input thread.
-    # The main thread just focuses on the UI.
+    # Single-threaded input: stdin is put into cbreak mode once and
+    # multiplexed with the render cadence via selectors, so there is no
+    # reader thread, no Queue, and no spin-polling - the select() call both
+    # provides the frame timing and wakes immediately on a keypress.
+    stdin_fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(stdin_fd)
+    sel = selectors.DefaultSelector()
+    sel.register(sys.stdin, selectors.EVENT_READ)
+    status_thread = threading.Thread(target=_status_poller, daemon=True)
+    status_thread.start()
+
     try:
-        with Live(layout, screen=True, redirect_stderr=False, refresh_per_second=2) as live:
+        tty.setcbreak(stdin_fd)
+        last_render_key = None
+        # auto_refresh=False: no background Rich thread redrawing identical
+        # content at 2Hz - we call live.refresh() only on dirty frames.
+        with Live(layout, screen=True, redirect_stderr=False, auto_refresh=False) as live:
             while True:
-                status_data = get_hindsight_status_from_api()
-                update_dashboard_layout(layout, status_data, app_state)
-                
-                if not input_queue.empty():
-                    key = input_queue.get().lower()
+                status_data = _status_slot[0]
+                # Rebuild the layout only when something visible changed: a
+                # fresh status payload, a mode/theme switch, or the flash
+                # message appearing/changing/expiring.
+                flash_active = bool(app_state.get("flash") and time.time() < app_state.get("flash_until", 0))
+                render_key = (id(status_data), app_state["mode"], app_state.get("theme_override"),
+                              app_state.get("flash") if flash_active else None)
+                if render_key != last_render_key:
+                    update_dashboard_layout(layout, status_data, app_state)
+                    last_render_key = render_key
+                    live.refresh()
+
+                if sel.select(timeout=0.5):
+                    # Read the raw fd: going through sys.stdin's TextIOWrapper
+                    # can buffer a second byte Python-side, which select (which
+                    # only sees the kernel fd) would then never report.
+                    key = os.read(stdin_fd, 1).decode(errors='replace').lower()
+                    if not key:
+                        # EOF (detached TTY): stdin stays readable forever, so
+                        # bail out rather than busy-looping on empty reads.
+                        break
                     if key == 'q':
                         break
-                    if key in "1234567t":
-                        if key == '1':
-                            start_script = os.path.join(SCRIPTS_PATH, "start_hindsight.sh")
-                            if os.path.isfile(start_script) and os.access(start_script, os.X_OK):
-                                run_command(f"'{start_script}'")
-                                flash(app_state, "Starting services...")
-                            else:
-                                flash(app_state, "start_hindsight.sh missing/not executable.")
-                        elif key == '2':
-                            stop_script = os.path.join(SCRIPTS_PATH, "stop_hindsight.sh")
-                            if os.path.exists(stop_script) and os.access(stop_script, os.X_OK):
-                                run_command(f"'{stop_script}'")
-                                flash(app_state, "Stopping services...")
-                            else:
-                                flash(app_state, "stop_hindsight.sh missing or not executable.")
-                        elif key == '3':
-                            # Use graceful wrapper to avoid 'bash crashed' dialog on Ctrl-C
-                            run_command(create_terminal_command(f"tail -n 200 -f {LOG_FILE}", graceful=True))
-                        elif key == '4':
-                            editor = os.environ.get('EDITOR', 'nano')
-                            run_command(create_terminal_command(f"'{editor}' '{config_path}'"))
-                        elif key == '5':
-                            run_command(create_terminal_command(f"'{os.path.join(SCRIPTS_PATH, 'configure.sh')}'"))
-                        elif key == '6':
-                            python_exec = os.path.join(VENV_PATH, "bin", "python")
-                            debugger_script = os.path.join(APP_PATH, "debugger.py")
-                            run_command(create_terminal_command(f"'{python_exec}' '{debugger_script}'"))
-                        elif key == '7':
-                            run_command("systemctl --user start hindsight-rebuild.service")
-                            flash(app_state, "Index cycle triggered.")
-                        elif key == 't':
-                            current = app_state.get('theme_override') or 'auto'
-                            nxt = {'auto': 'light', 'light': 'dark', 'dark': 'auto'}[current]
-                            app_state['theme_override'] = nxt
-                            flash(app_state, f"Theme: {nxt}")
-                time.sleep(0.5)
+                    handler = _KEY_HANDLERS.get(key)
+                    if handler:
+                        handler(app_state)
     finally:
-        # The input thread's finally block will handle restoring terminal settings.
+        sel.close()
+        termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_settings)
         console.print("[bold blue]Exiting Hindsight Manager.[/bold blue]")
@@ -26,15 +26,15 @@ import subprocess
 import threading
 import os
 import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from PIL import Image
-import configparser
-from utils import setup_logger
+from utils import setup_logger, load_conf
 import datetime
 
 # --- New Config Parser Logic ---
-config = configparser.ConfigParser()
-config_path = os.path.expanduser('~/hindsight/hindsight.conf')
-config.read(config_path)
+config = load_conf()
 
 # --- Fetching settings ---
 POLL_INTERVAL = config.getint('User Settings', 'POLL_INTERVAL')
@@ -49,14 +49,26 @@ logger = setup_logger("HindsightDaemon")
 
 # --- State Management ---
 processing_lock = threading.Lock()
-last_screenshot_paths = {}
+last_screenshot_digests = {}
+
+# OCR runs off the capture thread so a slow tesseract pass cannot delay the
+# next poll. The pending set is bounded: if tesseract wedges, new frames skip
+# OCR (with a warning) rather than queueing unbounded work in memory.
+_ocr_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ocr")
+_ocr_pending = set()
+_MAX_PENDING_OCR = 8
 _last_lock_check = 0.0
+_cached_locked = False
 _LOCK_CHECK_INTERVAL = 5  # seconds
 _last_lock_log = 0.0
 _LOCK_LOG_INTERVAL = 60  # seconds
 _suspend_state = False
 _last_suspend_log = 0.0
 _SUSPEND_LOG_INTERVAL = 60  # seconds
+# Set/cleared by the DBus lock watcher; while the watcher is healthy the main
+# loop reads this event instead of polling loginctl.
+_locked_event = threading.Event()
+_lock_watcher_ok = False
 
 def _resolve_session_id():
     sid = os.environ.get("XDG_SESSION_ID")
@@ -81,11 +93,9 @@ def session_locked():
     Cached for _LOCK_CHECK_INTERVAL seconds to reduce overhead.
     """
     global _last_lock_check, _cached_locked
-    now = time.time()
-    if ' _cached_locked' not in globals():
-        _cached_locked = False  # type: ignore
+    now = time.monotonic()
     if now - _last_lock_check < _LOCK_CHECK_INTERVAL:
-        return _cached_locked  # type: ignore
+        return _cached_locked
     _last_lock_check = now
     sid = _resolve_session_id()
     if not sid:
@@ -93,9 +103,13 @@ def session_locked():
     try:
         out = subprocess.check_output(["loginctl", "show-session", sid, "-p", "LockedHint"], text=True)
         _cached_locked = ("LockedHint=yes" in out)
-        return _cached_locked  # type: ignore
     except Exception:
-        return False
+        _cached_locked = False
+    return _cached_locked
+
+# The X tools need DISPLAY set; the environment is assembled once instead of
+# copying os.environ for every capture-cycle subprocess.
+_X_ENV = {**os.environ, 'DISPLAY': ':0'}
 
 def get_active_window_info():
     """Return the active window ID and title, or (None, None) on failure.
@@ -105,33 +119,64 @@ def get_active_window_info():
         window could not be determined.
     """
     try:
-        env = os.environ.copy()
-        env['DISPLAY'] = ':0'
-        window_id = subprocess.check_output(["xdotool", "getactivewindow"], env=env).strip().decode()
-        window_title_raw = subprocess.check_output(["xprop", "-id", window_id, "WM_NAME"], env=env).strip().decode()
-        window_title = window_title_raw.split(' = ')[1].strip('"')
+        # One xdotool invocation instead of xdotool + xprop: chained commands
+        # reuse the active window from xdotool's window stack, and only the
+        # trailing getactivewindow prints the id (chained ones stay silent),
+        # so the output is the title line(s) followed by the id.
+        out = subprocess.check_output(
+            ["xdotool", "getactivewindow", "getwindowname", "getactivewindow"],
+            env=_X_ENV).decode(errors='replace')
+        window_title, _, window_id = out.rstrip('\n').rpartition('\n')
+        if not window_id or not window_title:
+            return None, None
         return window_id, window_title
-    except (subprocess.CalledProcessError, IndexError) as e:
+    except subprocess.CalledProcessError as e:
         logger.error(f"Failed to get active window info: {e}")
         return None, None
 
-def extract_text_with_tesseract(screenshot_path, text_output_path):
-    """Run Tesseract OCR on an image and write the extracted text to a file.
+# Tesseract's runtime grows with pixel count but screen text stays readable
+# well below 4K resolution, so captures beyond this budget are scaled down
+# before OCR. The saved screenshot keeps its original resolution.
+_MAX_OCR_PIXELS = 2_000_000
+
+def _downsample_for_ocr(png_bytes):
+    """Return PNG bytes scaled to at most ``_MAX_OCR_PIXELS`` for OCR input."""
+    try:
+        img = Image.open(BytesIO(png_bytes))
+        w, h = img.size
+        if w * h <= _MAX_OCR_PIXELS:
+            return png_bytes
+        scale = (_MAX_OCR_PIXELS / (w * h)) ** 0.5
+        img.thumbnail((int(w * scale), int(h * scale)), Image.LANCZOS)
+        buf = BytesIO()
+        img.save(buf, format='PNG')
+        return buf.getvalue()
+    except Exception:
+        logger.exception("Downsampling for OCR failed; using original image.")
+        return png_bytes
+
+def _ocr_job(png_bytes, text_output_path):
+    """Worker-side OCR step: downsample if oversized, then run tesseract."""
+    extract_text_with_tesseract(_downsample_for_ocr(png_bytes), text_output_path)
+
+def extract_text_with_tesseract(png_bytes, text_output_path):
+    """Run Tesseract OCR on in-memory PNG bytes and write the text to a file.
 
     Args:
-        screenshot_path: Path to the input image file.
+        png_bytes: Raw PNG image data to OCR.
         text_output_path: Destination path for the OCR text output.
     """
     try:
-        ocr_text = subprocess.check_output(
-            ["tesseract", screenshot_path, "stdout"], stderr=subprocess.DEVNULL
-        ).decode()
-        with open(text_output_path, "w", encoding='utf-8') as f:
-            f.write(ocr_text)
+        result = subprocess.run(
+            ["tesseract", "stdin", "stdout"],
+            input=png_bytes, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            check=True)
+        with open(text_output_path, "wb") as f:
+            f.write(result.stdout)
     except subprocess.CalledProcessError as e:
-        logger.warning(f"Tesseract OCR failed with exit code {e.returncode} for {screenshot_path}.")
+        logger.warning(f"Tesseract OCR failed with exit code {e.returncode} for {text_output_path}.")
     except Exception:
-        logger.exception(f"An unexpected Tesseract OCR error occurred for {screenshot_path}")
+        logger.exception(f"An unexpected Tesseract OCR error occurred for {text_output_path}")
 
 def process_active_window():
     """Capture the active window and produce OCR text for it.
@@ -153,28 +198,33 @@ def process_active_window():
         timestamp = int(time.time())
         new_screenshot_path = os.path.join(SCREENSHOT_DIR, f"{window_id}_{timestamp}.png")
 
-        print(f"Attempting to save screenshot to: {new_screenshot_path}") # More debugging
+        logger.debug("Saving screenshot to %s", new_screenshot_path)
 
-        env = os.environ.copy()
-        env['DISPLAY'] = ':0'
-        subprocess.run(["maim", "--window", window_id, new_screenshot_path], check=True, capture_output=True, env=env)
+        # maim writes the PNG to stdout, so the frame is hashed and OCR'd
+        # entirely in memory; a duplicate never touches the disk at all.
+        result = subprocess.run(["maim", "--window", window_id], check=True,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=_X_ENV)
+        png_bytes = result.stdout
 
-        last_screenshot_path = last_screenshot_paths.get(window_id)
-        if last_screenshot_path and os.path.exists(last_screenshot_path):
-            try:
-                img_new = Image.open(new_screenshot_path)
-                img_old = Image.open(last_screenshot_path)
-                if list(img_new.getdata()) == list(img_old.getdata()):
-                    os.remove(new_screenshot_path)
-                    return
-            except Exception:
-                logger.exception("Image comparison failed. Processing file anyway.")
+        # maim encodes identical window content to identical PNG bytes, so a
+        # digest of the capture catches the same duplicates the old
+        # full-pixel comparison did without decoding the image.
+        new_digest = hashlib.blake2b(png_bytes, digest_size=16).digest()
+        if last_screenshot_digests.get(window_id) == new_digest:
+            return
 
-        last_screenshot_paths[window_id] = new_screenshot_path
+        last_screenshot_digests[window_id] = new_digest
+        with open(new_screenshot_path, "wb") as f:
+            f.write(png_bytes)
         ocr_filename = os.path.join(OCR_TEXT_DIR, f"{window_id}_{timestamp}.txt")
-        extract_text_with_tesseract(new_screenshot_path, ocr_filename)
+        if len(_ocr_pending) >= _MAX_PENDING_OCR:
+            logger.warning("OCR backlog full (%d pending); skipping OCR for %s.", len(_ocr_pending), ocr_filename)
+        else:
+            future = _ocr_pool.submit(_ocr_job, png_bytes, ocr_filename)
+            _ocr_pending.add(future)
+            future.add_done_callback(_ocr_pending.discard)
 
-        logger.info(f"Screenshot captured and processed for window: {window_title}")
+        logger.info("Screenshot captured and processed for window: %s", window_title)
 
     except subprocess.CalledProcessError:
         logger.warning("maim failed, likely because the window closed.")
@@ -219,7 +269,53 @@ def main():
         except Exception:
             logger.debug("Suspend watcher terminated or failed.")
 
+    # Companion watcher for session lock: loginctl polling costs a fork every
+    # few seconds, while login1 broadcasts LockedHint changes over DBus. The
+    # polling path in session_locked() stays as the fallback whenever the
+    # watcher is not running.
+    def lock_watcher():
+        global _lock_watcher_ok
+        if not PAUSE_WHEN_LOCKED:
+            return
+        if not shutil.which("dbus-monitor"):
+            logger.debug("dbus-monitor not found; lock detection falls back to polling.")
+            return
+        cmd = ["dbus-monitor", "--system",
+               "type='signal',interface='org.freedesktop.DBus.Properties',member='PropertiesChanged',path_namespace='/org/freedesktop/login1/session'"]
+        try:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+                if proc.stdout is None:
+                    return
+                # Seed from the current state before trusting the event: the
+                # signal stream only carries transitions, so a daemon started
+                # on an already-locked session would otherwise capture the
+                # lock screen until the first unlock/relock.
+                if session_locked():
+                    _locked_event.set()
+                else:
+                    _locked_event.clear()
+                _lock_watcher_ok = True
+                saw_locked_hint = False
+                for line in proc.stdout:
+                    # dbus-monitor prints the property name and its variant
+                    # value on separate lines.
+                    if 'LockedHint' in line:
+                        saw_locked_hint = True
+                    elif saw_locked_hint and 'boolean' in line:
+                        if 'true' in line and not _locked_event.is_set():
+                            _locked_event.set()
+                            logger.info("Session locked; pausing capture.")
+                        elif 'false' in line and _locked_event.is_set():
+                            _locked_event.clear()
+                            logger.info("Session unlocked; resuming capture.")
+                        saw_locked_hint = False
+        except Exception:
+            logger.debug("Lock watcher terminated or failed.")
+        finally:
+            _lock_watcher_ok = False
+
     threading.Thread(target=suspend_watcher, name="SuspendWatcher", daemon=True).start()
+    threading.Thread(target=lock_watcher, name="LockWatcher", daemon=True).start()
     try:
         while True:
             if PAUSE_ON_SUSPEND and _suspend_state:
@@ -230,7 +326,8 @@ def main():
                     _last_suspend_log = now
                 time.sleep(POLL_INTERVAL)
                 continue
-            if PAUSE_WHEN_LOCKED and session_locked():
+            locked = _locked_event.is_set() if _lock_watcher_ok else session_locked()
+            if PAUSE_WHEN_LOCKED and locked:
                 global _last_lock_log
                 now = time.time()
                 if now - _last_lock_log > _LOCK_LOG_INTERVAL:
@@ -22,28 +22,44 @@ semantic index used by Hindsight. The primary entrypoint is
 
 
 import os
-import glob
 import json
+import hashlib
+import sqlite3
 import numpy as np
 import faiss
+import torch
 import subprocess
 import shutil
 import signal
+import socket
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from sentence_transformers import SentenceTransformer
-import configparser
-from utils import setup_logger
+from utils import setup_logger, load_conf
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dump_to(obj, path):
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dump_to(obj, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f)
 
 # --- New Config Parser Logic ---
-config = configparser.ConfigParser()
-config_path = os.path.expanduser('~/hindsight/hindsight.conf')
-config.read(config_path)
+config = load_conf()
 
 # --- Fetching settings ---
 DB_DIR = config.get('System Paths', 'DB_DIR')
 OCR_TEXT_DIR = config.get('System Paths', 'OCR_TEXT_DIR')
 FAISS_INDEX_PATH = os.path.join(DB_DIR, 'hindsight_faiss.index')
 ID_MAP_PATH = os.path.join(DB_DIR, 'hindsight_id_map.json')
+EMB_CACHE_PATH = os.path.join(DB_DIR, 'emb_cache.sqlite')
 # The embedding model is a core component, not a user setting, so it's defined here.
 EMBEDDING_MODEL = 'all-mpnet-base-v2'
 ENABLE_RECOLL = config.getboolean('Search', 'ENABLE_RECOLL', fallback=True)
@@ -57,9 +73,111 @@ FAISS_MAX_SECONDS = config.getint('Search', 'FAISS_MAX_SECONDS', fallback=0)
 logger = setup_logger("HindsightRebuildIndex")
 
 # --- Tunable constants (could be promoted to config later) ---
-BATCH_SIZE = 64  # Number of documents to embed per batch
+BATCH_SIZE = 256  # Number of documents to embed per flush (amortizes encode + persist overhead)
 EMBED_BATCH_SIZE = 32  # Internal batch size for model.encode
 LOG_EVERY = 500  # Log a progress update every N processed files
+# Each encode worker process loads its own model copy, so the pool only pays
+# for its startup on big CPU-bound backlogs (initial builds, long downtime).
+MP_ENCODE_MIN_FILES = 1000
+# Vectors accumulated in the index before it is rewritten to disk. Serializing
+# the whole index per 256-file batch made persistence O(n^2) over a large
+# cycle; deferring it trades at most this much re-embedding work on a crash.
+PERSIST_EVERY = 2048
+
+# The model loads lazily and stays resident for the life of the process, so
+# serve mode pays the multi-second startup once rather than per cycle.
+_model = None
+_model_device = None
+
+def _get_model():
+    """Load the SentenceTransformer once per process and reuse it."""
+    global _model, _model_device
+    if _model is None:
+        _model_device = "cuda" if torch.cuda.is_available() else "cpu"
+        logger.info(f"Loading sentence embedding model: {EMBEDDING_MODEL} (device={_model_device})")
+        _model = SentenceTransformer(EMBEDDING_MODEL, device=_model_device)
+    return _model
+
+def _open_emb_cache():
+    """Open (creating if needed) the on-disk embedding cache.
+
+    Embeddings are keyed by a blake2b digest of the file content, so a forced
+    rebuild ('Clean FAISS Index') or a crash-replayed window reuses cached
+    vectors instead of re-running the model over unchanged text. Vectors are
+    stored as float16 blobs - half the disk for negligible recall impact -
+    and widened back to float32 on load.
+    """
+    conn = sqlite3.connect(EMB_CACHE_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB)")
+    return conn
+
+def _new_faiss_index():
+    """Create a fresh ID-mapped HNSW index (768-dim, L2).
+
+    HNSW searches in logarithmic time where the flat index scans every
+    vector; at a year of captures that is the difference between
+    sub-millisecond and tens-of-millisecond queries. M=32 neighbours with
+    efConstruction=80 is a standard recall/build-cost middle ground.
+    """
+    base = faiss.IndexHNSWFlat(768, 32)
+    base.hnsw.efConstruction = 80
+    base.hnsw.efSearch = 64
+    return faiss.IndexIDMap(base)
+
+def _read_text_file(file_path):
+    """Read one OCR file; return (path, text) or None when empty/unreadable.
+
+    Reads bytes and rejects empty/whitespace files before paying for the
+    decode; 'replace' keeps a stray non-UTF-8 byte from tesseract from
+    aborting the file.
+    """
+    try:
+        # OCR of a blank screen leaves a 0-1 byte file; a stat is cheaper
+        # than opening and reading just to discard it.
+        if os.stat(file_path).st_size < 2:
+            return None
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        logger.exception(f"Failed to read file: {file_path}")
+        return None
+    if not raw.strip():
+        return None
+    return file_path, raw.decode('utf-8', errors='replace')
+
+def _iter_file_texts(paths, workers=8, slice_size=256):
+    """Yield (path, text) tuples, reading files with a small thread pool.
+
+    File reads release the GIL, so a few threads hide the per-file open/read
+    latency that otherwise serializes with embedding. Paths are handed to the
+    pool one slice at a time so at most ``slice_size`` contents are buffered
+    regardless of how far the workers get ahead of the consumer.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i in range(0, len(paths), slice_size):
+            yield from pool.map(_read_text_file, paths[i:i + slice_size], chunksize=32)
+
+# Listing keyed on the directory's mtime: adding or removing an entry bumps
+# it, so an unchanged directory is answered with one stat. Mostly pays off in
+# serve mode, where consecutive cycles in one process often see no new files.
+_dir_listing_cache = {"token": None, "paths": ()}
+
+def _list_ocr_files():
+    """Return all .txt paths in ``OCR_TEXT_DIR``, cached on directory mtime."""
+    try:
+        token = os.stat(OCR_TEXT_DIR).st_mtime_ns
+    except OSError:
+        return ()
+    if token == _dir_listing_cache["token"]:
+        return _dir_listing_cache["paths"]
+    try:
+        with os.scandir(OCR_TEXT_DIR) as it:
+            paths = tuple(e.path for e in it if e.name.endswith('.txt'))
+    except OSError:
+        return ()
+    _dir_listing_cache["token"] = token
+    _dir_listing_cache["paths"] = paths
+    return paths
 
 def get_unprocessed_files(id_map):
     """Return .txt files that are not present in the supplied ID map.
@@ -72,8 +190,9 @@ def get_unprocessed_files(id_map):
         present in ``OCR_TEXT_DIR`` but missing from ``id_map``.
     """
     indexed_files = set(id_map)
-    all_files = set(glob.glob(os.path.join(OCR_TEXT_DIR, "*.txt")))
-    return sorted(list(all_files - indexed_files))
+    new_files = [p for p in _list_ocr_files() if p not in indexed_files]
+    new_files.sort()
+    return new_files
 
 def run_recoll_incremental():
     """Run an incremental Recoll update if enabled.
@@ -129,7 +248,8 @@ def incremental_rebuild_faiss(dry_run=False):
 
     Optimizations added:
       * Batch embedding (reduces per-call overhead & speeds up large updates).
-      * Incremental flush: write index + id map after each batch for resilience.
+      * Deferred persistence: index + id map are rewritten only every
+        PERSIST_EVERY new vectors (and once at the end), not per batch.
       * Progress logging every LOG_EVERY files.
       * Memory friendly: do not hold all embeddings simultaneously.
     """
@@ -156,19 +276,19 @@ def incremental_rebuild_faiss(dry_run=False):
     if os.path.exists(FAISS_INDEX_PATH) and os.path.exists(ID_MAP_PATH):
         try:
             faiss_index = faiss.read_index(FAISS_INDEX_PATH)
-            with open(ID_MAP_PATH, 'r', encoding='utf-8') as f:
-                id_to_filepath_map = json.load(f)
+            with open(ID_MAP_PATH, 'rb') as f:
+                id_to_filepath_map = _json_loads(f.read())
             if not isinstance(id_to_filepath_map, list):  # safety
                 logger.warning("ID map was not a list; reinitializing.")
                 id_to_filepath_map = []
             logger.info(f"Loaded existing index with {faiss_index.ntotal} vectors and ID map size {len(id_to_filepath_map)}.")
         except Exception:
             logger.exception("Failed loading existing index; starting fresh.")
-            faiss_index = faiss.IndexIDMap(faiss.IndexFlatL2(768))
+            faiss_index = _new_faiss_index()
             id_to_filepath_map = []
     else:
         logger.info("No existing index found. Initializing a new one.")
-        faiss_index = faiss.IndexIDMap(faiss.IndexFlatL2(768))
+        faiss_index = _new_faiss_index()
         id_to_filepath_map = []
 
     unprocessed_files = get_unprocessed_files(id_to_filepath_map)
@@ -187,24 +307,100 @@ def incremental_rebuild_faiss(dry_run=False):
         logger.info("[DRY RUN] Exiting before processing.")
         return
 
-    # Initialize embedding model once
-    logger.info(f"Loading sentence embedding model: {EMBEDDING_MODEL}")
-    model = SentenceTransformer(EMBEDDING_MODEL)
+    # Model is process-resident: first cycle loads it, later cycles reuse it
+    model = _get_model()
+    device = _model_device
+
+    # Large CPU-only cycles are spread across worker processes; small ones
+    # and GPU runs encode in-process.
+    encode_pool = None
+    if device == "cpu" and total_new >= MP_ENCODE_MIN_FILES:
+        try:
+            encode_pool = model.start_multi_process_pool()
+            logger.info(f"Started multi-process encode pool for {total_new} files.")
+        except Exception:
+            logger.exception("Could not start multi-process encode pool; encoding in-process.")
+            encode_pool = None
 
     processed = 0  # number of non-empty files encountered (queued)
     added_files_count = 0  # number of files actually flushed into the index
+    unpersisted = 0  # vectors added to the in-memory index but not yet on disk
     time_budget_start = time.time()
     batch_texts = []
     batch_paths = []
 
+    emb_cache = None
+    try:
+        os.makedirs(DB_DIR, exist_ok=True)
+        emb_cache = _open_emb_cache()
+    except Exception:
+        logger.exception("Could not open embedding cache; embedding without it.")
+
+    def encode_texts(subset):
+        # Unit-length vectors make L2 distance monotonic with cosine
+        # similarity, so ranking matches how the model was trained; the
+        # query side normalizes identically in hindsight_search.
+        bsz = min(EMBED_BATCH_SIZE, len(subset))
+        if encode_pool is not None:
+            emb = model.encode_multi_process(subset, encode_pool, batch_size=bsz,
+                                             normalize_embeddings=True)
+        else:
+            # inference_mode drops autograd bookkeeping; on a GPU the forward
+            # pass also runs under fp16 autocast (the fp32 cast below keeps
+            # FAISS input dtype unchanged either way).
+            with torch.inference_mode():
+                if device == "cuda":
+                    with torch.autocast("cuda", dtype=torch.float16):
+                        emb = model.encode(subset, batch_size=bsz, convert_to_numpy=True,
+                                           show_progress_bar=False, normalize_embeddings=True)
+                else:
+                    emb = model.encode(subset, batch_size=bsz, convert_to_numpy=True,
+                                       show_progress_bar=False, normalize_embeddings=True)
+        return emb.astype('float32')
+
+    def persist_index():
+        nonlocal unpersisted
+        if unpersisted == 0:
+            return
+        try:
+            os.makedirs(os.path.dirname(FAISS_INDEX_PATH), exist_ok=True)
+        except Exception:
+            logger.exception(f"Could not create directory for FAISS index: {FAISS_INDEX_PATH}")
+        faiss.write_index(faiss_index, FAISS_INDEX_PATH)
+        _json_dump_to(id_to_filepath_map, ID_MAP_PATH)
+        logger.info("Persisted index (%d vectors, %d new since last write).", faiss_index.ntotal, unpersisted)
+        unpersisted = 0
+
     def flush_batch(texts, paths):
         nonlocal faiss_index, id_to_filepath_map
-        nonlocal added_files_count
+        nonlocal added_files_count, unpersisted
         if not texts:
             return
         try:
-            embeddings = model.encode(texts, batch_size=min(EMBED_BATCH_SIZE, len(texts)))
-            vectors = np.array(embeddings).astype('float32')
+            digests = [hashlib.blake2b(t.encode('utf-8'), digest_size=16).digest() for t in texts]
+            vectors = np.empty((len(texts), 768), dtype='float32')
+            miss_idx = list(range(len(texts)))
+            if emb_cache is not None:
+                miss_idx = []
+                for i, d in enumerate(digests):
+                    row = emb_cache.execute("SELECT vec FROM embeddings WHERE hash = ?", (d,)).fetchone()
+                    if row:
+                        vectors[i] = np.frombuffer(row[0], dtype='float16').astype('float32')
+                    else:
+                        miss_idx.append(i)
+            if miss_idx:
+                fresh = encode_texts([texts[i] for i in miss_idx])
+                for j, i in enumerate(miss_idx):
+                    vectors[i] = fresh[j]
+                if emb_cache is not None:
+                    try:
+                        emb_cache.executemany(
+                            "INSERT OR REPLACE INTO embeddings (hash, vec) VALUES (?, ?)",
+                            [(digests[i], fresh[j].astype('float16').tobytes())
+                             for j, i in enumerate(miss_idx)])
+                        emb_cache.commit()
+                    except sqlite3.Error:
+                        logger.exception("Embedding cache write failed; continuing.")
             start_id = len(id_to_filepath_map)
             new_ids = np.arange(start_id, start_id + len(paths))
             try:
@@ -216,43 +412,49 @@ def incremental_rebuild_faiss(dry_run=False):
                     logger.warning("Falling back to add() without IDs; ID mapping may become inconsistent.")
                     faiss_index.add(vectors)  # type: ignore
             id_to_filepath_map.extend(paths)
-            # Persist after each batch for durability
-            try:
-                os.makedirs(os.path.dirname(FAISS_INDEX_PATH), exist_ok=True)
-            except Exception:
-                logger.exception(f"Could not create directory for FAISS index: {FAISS_INDEX_PATH}")
-            faiss.write_index(faiss_index, FAISS_INDEX_PATH)
-            with open(ID_MAP_PATH, 'w', encoding='utf-8') as f:
-                json.dump(id_to_filepath_map, f)
             added_files_count += len(paths)
-            logger.info(f"Flushed batch of {len(paths)} files. Total indexed now {len(id_to_filepath_map)}.")
+            # Persistence is batched separately: index and id map are only
+            # rewritten once PERSIST_EVERY vectors have accumulated (and once
+            # more at cycle end), always together so they stay consistent.
+            unpersisted += len(paths)
+            if unpersisted >= PERSIST_EVERY:
+                persist_index()
+            logger.info("Flushed batch of %d files. Total indexed now %d.", len(paths), len(id_to_filepath_map))
         except Exception:
             logger.exception("Failed to flush a batch; continuing with next batch.")
 
-    for file_path in unprocessed_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            if not content.strip():
-                continue
-            batch_texts.append(content)
-            batch_paths.append(file_path)
-            processed += 1
-            if len(batch_texts) >= BATCH_SIZE:
-                flush_batch(batch_texts, batch_paths)
-                batch_texts.clear()
-                batch_paths.clear()
-            if processed % LOG_EVERY == 0:
-                elapsed = time.time() - start_time
-                logger.info(f"Progress: {processed}/{total_new} ({processed/total_new*100:.1f}%) in {elapsed:.1f}s")
-            if FAISS_MAX_SECONDS and (time.time() - time_budget_start) > FAISS_MAX_SECONDS:
-                logger.warning(f"FAISS time budget {FAISS_MAX_SECONDS}s exceeded; stopping early at {processed} files.")
-                break
-        except Exception:
-            logger.exception(f"Failed to process file: {file_path}")
+    for item in _iter_file_texts(unprocessed_files):
+        if item is None:
+            continue
+        file_path, content = item
+        batch_texts.append(content)
+        batch_paths.append(file_path)
+        processed += 1
+        if len(batch_texts) >= BATCH_SIZE:
+            flush_batch(batch_texts, batch_paths)
+            batch_texts.clear()
+            batch_paths.clear()
+        if processed % LOG_EVERY == 0:
+            elapsed = time.time() - start_time
+            logger.info(f"Progress: {processed}/{total_new} ({processed/total_new*100:.1f}%) in {elapsed:.1f}s")
+        if FAISS_MAX_SECONDS and (time.time() - time_budget_start) > FAISS_MAX_SECONDS:
+            logger.warning(f"FAISS time budget {FAISS_MAX_SECONDS}s exceeded; stopping early at {processed} files.")
+            break
 
-    # Flush any residual batch
+    # Flush any residual batch, then write whatever is still memory-only
     flush_batch(batch_texts, batch_paths)
+    try:
+        persist_index()
+    except Exception:
+        logger.exception("Final index persist failed.")
+
+    if encode_pool is not None:
+        try:
+            model.stop_multi_process_pool(encode_pool)
+        except Exception:
+            logger.exception("Failed to stop multi-process encode pool.")
+    if emb_cache is not None:
+        emb_cache.close()
 
     elapsed = time.time() - start_time
     if added_files_count != total_new:
@@ -260,5 +462,42 @@ def incremental_rebuild_faiss(dry_run=False):
     else:
         logger.info(f"Index update cycle completed. Added {added_files_count} files in {elapsed:.1f} seconds. Index size: {faiss_index.ntotal} vectors.")
 
+def serve():
+    """Stay resident and run one rebuild cycle per Unix-socket connection.
+
+    The one-shot CLI reloads the embedding model every run, which costs more
+    than a typical incremental cycle itself. Under ``--serve`` the process
+    listens on ``DB_DIR/rebuild.sock`` and the systemd timer (or anything
+    else, e.g. ``socat - UNIX:.../rebuild.sock``) just connects to trigger a
+    cycle against the already-loaded model.
+    """
+    socket_path = os.path.join(DB_DIR, 'rebuild.sock')
+    os.makedirs(DB_DIR, exist_ok=True)
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    _get_model()
+    logger.info(f"Rebuild server ready on {socket_path}.")
+    while True:
+        conn, _ = server.accept()
+        try:
+            incremental_rebuild_faiss()
+            conn.sendall(b"ok\n")
+        except Exception:
+            logger.exception("Rebuild cycle failed in serve mode.")
+            try:
+                conn.sendall(b"error\n")
+            except OSError:
+                pass
+        finally:
+            conn.close()
+
 if __name__ == "__main__":
-    incremental_rebuild_faiss()
+    if "--serve" in sys.argv[1:]:
+        serve()
+    else:
+        incremental_rebuild_faiss()